@@ -4,7 +4,7 @@ Initialize ArcTraiders trade worksheets.
 
 What this script does:
 1) Ensures two sheets (tabs): ActiveTrades, CompletedTrades.
-2) Ensures headers are present in strict order (rewrites if missing/mismatched).
+2) Ensures headers are present in strict order (row 1 is always rewritten).
 3) Applies classic setup (no attempt to create real Google Sheets Tables):
    - Freeze header row
    - Basic filter over the table
@@ -15,12 +15,14 @@ What this script does:
 Run:
   export GOOGLE_SA_JSON_PATH="./service_account.json"
   export GOOGLE_SHEET_ID="<your spreadsheet id>"
-  python scripts/sheets_setup.py
+  python scripts/sheets_setup.py            # no-op if already set up with this config
+  python scripts/sheets_setup.py --force    # re-apply everything
 """
 
+import hashlib
 import os
 import sys
-from typing import Tuple, List
+from typing import Dict, Tuple, List, Optional, Sequence
 
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
@@ -41,16 +43,34 @@ HEADERS: List[str] = [
 
 STATUS_ALLOWED = ["OPEN", "ACCEPTED", "COMPLETED", "CANCELLED"]
 
+NEW_SHEET_ROWS = 1000  # grid size for tabs created by this script
+
 # Column index helpers (0-based for API requests)
 STATUS_COL = 1
 TIMESTAMP_COLS = [8, 9, 10]             # created_ts, accepted_ts, completed_ts
 ID_COLS = [0, 4, 6, 12, 13]             # offer_id, offerer_id, accepter_id, guild_id, channel_id
+TEXT_COLS: Tuple[int, ...] = tuple(sorted(set(ID_COLS + TIMESTAMP_COLS)))
+
+# Fingerprint of the setup this script applies, stored as spreadsheet developer
+# metadata so an unchanged rerun can skip re-applying headers and formatting.
+CFG_METADATA_KEY = "arcTraidersCfg"
+CFG_HASH = hashlib.blake2b(
+    repr((HEADERS, STATUS_ALLOWED, STATUS_COL, ID_COLS, TIMESTAMP_COLS)).encode(), digest_size=16
+).hexdigest()
+
+# Constant request fragments (only sheetId/ranges vary per call)
+_STATUS_VALUES = [{"userEnteredValue": v} for v in STATUS_ALLOWED]
+_STATUS_CONDITION = {"type": "ONE_OF_LIST", "values": _STATUS_VALUES}
+_STATUS_CELL = {"dataValidation": {"condition": _STATUS_CONDITION, "strict": True, "showCustomUi": True}}
+_TEXT_CELL = {"userEnteredFormat": {"numberFormat": {"type": "TEXT"}}}
+_BOLD_CELL = {"userEnteredFormat": {"textFormat": {"bold": True}}}
 
 
 def _sheets_service():
     scopes = ["https://www.googleapis.com/auth/spreadsheets"]
     creds = Credentials.from_service_account_file(SA_PATH, scopes=scopes)
-    return build("sheets", "v4", credentials=creds)
+    # Bundled discovery doc: no HTTPS fetch of the Sheets API description at startup
+    return build("sheets", "v4", credentials=creds, static_discovery=True, cache_discovery=False)
 
 
 def _get_spreadsheet_id(service) -> str:
@@ -61,45 +81,73 @@ def _get_spreadsheet_id(service) -> str:
     sys.exit(2)
 
 
-def _get_sheet_map(service, spreadsheet_id: str) -> dict:
-    meta = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+def _get_spreadsheet_meta(service, spreadsheet_id: str) -> Tuple[Dict[str, Tuple[int, int]], Optional[dict]]:
+    """
+    One spreadsheets().get for everything setup needs.
+    Returns ({title: (sheet_id, row_count)}, stored config developerMetadata or None).
+    """
+    meta = service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id,
+        fields="sheets.properties(title,sheetId,gridProperties.rowCount),"
+               "developerMetadata(metadataId,metadataKey,metadataValue)",
+    ).execute()
     sheets = meta.get("sheets", [])
-    return {s["properties"]["title"]: s["properties"]["sheetId"] for s in sheets}
-
-
-def _add_sheet_if_missing(service, spreadsheet_id: str, title: str, cols: int) -> int:
-    sheet_map = _get_sheet_map(service, spreadsheet_id)
-    if title in sheet_map:
-        return sheet_map[title]
+    sheet_map = {
+        s["properties"]["title"]: (
+            s["properties"]["sheetId"],
+            s["properties"].get("gridProperties", {}).get("rowCount", NEW_SHEET_ROWS),
+        )
+        for s in sheets
+    }
+    cfg_meta = next(
+        (m for m in meta.get("developerMetadata", []) if m.get("metadataKey") == CFG_METADATA_KEY),
+        None,
+    )
+    return sheet_map, cfg_meta
+
+
+def _add_sheets_if_missing(service, spreadsheet_id: str, sheet_map: Dict[str, Tuple[int, int]],
+                           titles_and_cols: List[Tuple[str, int]]) -> Dict[str, Tuple[int, int]]:
+    """Add any missing tabs in a single batchUpdate; returns sheet_map extended with the new tabs."""
+    sheet_map = dict(sheet_map)
     reqs = [{
         "addSheet": {
-            "properties": {"title": title, "gridProperties": {"rowCount": 1000, "columnCount": cols}}
+            "properties": {"title": title, "gridProperties": {"rowCount": NEW_SHEET_ROWS, "columnCount": cols}}
         }
-    }]
-    resp = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id, body={"requests": reqs}
-    ).execute()
-    sheet_id = resp["replies"][0]["addSheet"]["properties"]["sheetId"]
-    return sheet_id
-
-
-def _read_row_1(service, spreadsheet_id: str, title: str) -> List[str]:
-    rng = f"{title}!1:1"
-    val = service.spreadsheets().values().get(spreadsheetId=spreadsheet_id, range=rng).execute()
-    values = val.get("values", [])
-    return values[0] if values else []
-
-
-def _write_headers_strict(service, spreadsheet_id: str, title: str) -> None:
-    row1 = _read_row_1(service, spreadsheet_id, title)
-    if row1 != HEADERS:
-        rng = f"{title}!A1:{_col_a1(len(HEADERS))}1"
-        service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=rng,
-            valueInputOption="RAW",
-            body={"values": [HEADERS]},
+    } for title, cols in titles_and_cols if title not in sheet_map]
+    if reqs:
+        resp = service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body={"requests": reqs}
         ).execute()
+        for reply in resp["replies"]:
+            props = reply["addSheet"]["properties"]
+            row_count = props.get("gridProperties", {}).get("rowCount", NEW_SHEET_ROWS)
+            sheet_map[props["title"]] = (props["sheetId"], row_count)
+    return sheet_map
+
+
+def _store_cfg_hash(cfg_meta: Optional[dict]) -> List[dict]:
+    """Request that records CFG_HASH on the spreadsheet (create or update the existing entry)."""
+    if cfg_meta is None:
+        return [{"createDeveloperMetadata": {"developerMetadata": {
+            "metadataKey": CFG_METADATA_KEY,
+            "metadataValue": CFG_HASH,
+            "location": {"spreadsheet": True},
+            "visibility": "DOCUMENT",
+        }}}]
+    return [{"updateDeveloperMetadata": {
+        "dataFilters": [{"developerMetadataLookup": {"metadataId": cfg_meta["metadataId"]}}],
+        "developerMetadata": {"metadataValue": CFG_HASH},
+        "fields": "metadataValue",
+    }}]
+
+
+def _write_headers_strict(title: str) -> dict:
+    """
+    Return a values.batchUpdate data entry that (re)writes the header row.
+    The write is idempotent, so it is cheaper to always send it than to read row 1 first.
+    """
+    return {"range": HEADER_RANGE_TEMPLATE.format(title=title), "values": [HEADERS]}
 
 
 def _col_a1(n: int) -> str:
@@ -111,83 +159,93 @@ def _col_a1(n: int) -> str:
     return s
 
 
-def _freeze_header(service, spreadsheet_id: str, sheet_id: int):
-    reqs = [{"updateSheetProperties": {
+LAST_COL_A1 = _col_a1(len(HEADERS))
+HEADER_RANGE_TEMPLATE = f"{{title}}!A1:{LAST_COL_A1}1"
+
+
+# Request builders below return lists of batchUpdate sub-requests; the caller
+# sends them all in one spreadsheets().batchUpdate round-trip.
+
+def _freeze_header(sheet_id: int) -> List[dict]:
+    return [{"updateSheetProperties": {
         "properties": {"sheetId": sheet_id, "gridProperties": {"frozenRowCount": 1}},
         "fields": "gridProperties.frozenRowCount"
     }}]
-    service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": reqs}).execute()
 
 
-def _basic_filter(service, spreadsheet_id: str, sheet_id: int, col_count: int):
-    reqs = [{
+def _basic_filter(sheet_id: int, row_count: int, col_count: int) -> List[dict]:
+    return [{
         "setBasicFilter": {
             "filter": {
                 "range": {
                     "sheetId": sheet_id,
                     "startRowIndex": 0,
-                    "endRowIndex": 10000,
+                    "endRowIndex": row_count,
                     "startColumnIndex": 0,
                     "endColumnIndex": col_count
                 }
             }
         }
     }]
-    service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": reqs}).execute()
 
 
-def _text_format_cols(service, spreadsheet_id: str, sheet_id: int, columns: List[int]):
+def _merge_runs(columns: Sequence[int]) -> List[Tuple[int, int]]:
+    """Collapse column indexes into contiguous [start, end) runs."""
+    runs: List[Tuple[int, int]] = []
+    for c in sorted(set(columns)):
+        if runs and runs[-1][1] == c:
+            runs[-1] = (runs[-1][0], c + 1)
+        else:
+            runs.append((c, c + 1))
+    return runs
+
+
+TEXT_COL_RUNS = _merge_runs(TEXT_COLS)
+
+
+def _text_format_cols(sheet_id: int, row_count: int, runs: Sequence[Tuple[int, int]]) -> List[dict]:
+    # One repeatCell per contiguous run of columns rather than per column
     reqs = []
-    for c in columns:
+    for start, end in runs:
         reqs.append({
             "repeatCell": {
                 "range": {
                     "sheetId": sheet_id,
                     "startRowIndex": 1,          # skip header
-                    "endRowIndex": 10000,
-                    "startColumnIndex": c,
-                    "endColumnIndex": c + 1
+                    "endRowIndex": row_count,
+                    "startColumnIndex": start,
+                    "endColumnIndex": end
                 },
-                "cell": {"userEnteredFormat": {"numberFormat": {"type": "TEXT"}}},
+                "cell": _TEXT_CELL,
                 "fields": "userEnteredFormat.numberFormat"
             }
         })
-    service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": reqs}).execute()
+    return reqs
 
 
-def _status_validation(service, spreadsheet_id: str, sheet_id: int):
-    reqs = [{
+def _status_validation(sheet_id: int, row_count: int) -> List[dict]:
+    return [{
         "repeatCell": {
             "range": {
                 "sheetId": sheet_id,
                 "startRowIndex": 1,
-                "endRowIndex": 10000,
+                "endRowIndex": row_count,
                 "startColumnIndex": STATUS_COL,
                 "endColumnIndex": STATUS_COL + 1
             },
-            "cell": {
-                "dataValidation": {
-                    "condition": {
-                        "type": "ONE_OF_LIST",
-                        "values": [{"userEnteredValue": v} for v in STATUS_ALLOWED]
-                    },
-                    "strict": True,
-                    "showCustomUi": True
-                }
-            },
+            "cell": _STATUS_CELL,
             "fields": "dataValidation"
         }
     }]
-    service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": reqs}).execute()
 
 
-def _bold_header_and_autosize(service, spreadsheet_id: str, sheet_id: int, col_count: int):
-    reqs = [
+def _bold_header_and_autosize(sheet_id: int, col_count: int) -> List[dict]:
+    return [
         {
             "repeatCell": {
                 "range": {"sheetId": sheet_id, "startRowIndex": 0, "endRowIndex": 1,
                           "startColumnIndex": 0, "endColumnIndex": col_count},
-                "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
+                "cell": _BOLD_CELL,
                 "fields": "userEnteredFormat.textFormat.bold"
             }
         },
@@ -198,15 +256,17 @@ def _bold_header_and_autosize(service, spreadsheet_id: str, sheet_id: int, col_c
             }
         }
     ]
-    service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": reqs}).execute()
 
 
-def ensure_trade_sheets() -> Tuple[int, int]:
+def ensure_trade_sheets(force: bool = False) -> Tuple[int, int]:
     """
     Idempotent initializer (classic setup only; no addTable):
       - ensures ActiveTrades and CompletedTrades sheets exist
       - enforces strict header order
       - applies header freeze, filter, validation, text formats, bold, auto-resize
+        (all formatting goes out in a single batchUpdate)
+      - skips headers/formatting when both tabs exist and the stored config hash
+        matches, unless force=True
     Returns: (active_sheet_id, completed_sheet_id)
     """
     if not SPREADSHEET_ID and not SPREADSHEET_NAME:
@@ -217,18 +277,44 @@ def ensure_trade_sheets() -> Tuple[int, int]:
     spreadsheet_id = _get_spreadsheet_id(service)
 
     col_count = len(HEADERS)
-    active_id = _add_sheet_if_missing(service, spreadsheet_id, ACTIVE_TAB, col_count)
-    completed_id = _add_sheet_if_missing(service, spreadsheet_id, COMPLETED_TAB, col_count)
-
-    _write_headers_strict(service, spreadsheet_id, ACTIVE_TAB)
-    _write_headers_strict(service, spreadsheet_id, COMPLETED_TAB)
+    sheet_map, cfg_meta = _get_spreadsheet_meta(service, spreadsheet_id)
+    up_to_date = (
+        not force
+        and ACTIVE_TAB in sheet_map and COMPLETED_TAB in sheet_map
+        and cfg_meta is not None and cfg_meta.get("metadataValue") == CFG_HASH
+    )
+    if up_to_date:
+        active_id, completed_id = sheet_map[ACTIVE_TAB][0], sheet_map[COMPLETED_TAB][0]
+        print("Sheets already initialized with current config; nothing to do.")
+        print(f" - {ACTIVE_TAB} (sheetId={active_id})")
+        print(f" - {COMPLETED_TAB} (sheetId={completed_id})")
+        return active_id, completed_id
+
+    sheet_map = _add_sheets_if_missing(
+        service, spreadsheet_id, sheet_map, [(ACTIVE_TAB, col_count), (COMPLETED_TAB, col_count)]
+    )
+    active_id, active_rows = sheet_map[ACTIVE_TAB]
+    completed_id, completed_rows = sheet_map[COMPLETED_TAB]
+
+    service.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={
+            "valueInputOption": "RAW",
+            "data": [_write_headers_strict(ACTIVE_TAB), _write_headers_strict(COMPLETED_TAB)],
+        },
+    ).execute()
 
-    for sheet_id in (active_id, completed_id):
-        _freeze_header(service, spreadsheet_id, sheet_id)
-        _basic_filter(service, spreadsheet_id, sheet_id, col_count)
-        _status_validation(service, spreadsheet_id, sheet_id)
-        _text_format_cols(service, spreadsheet_id, sheet_id, list(set(ID_COLS + TIMESTAMP_COLS)))
-        _bold_header_and_autosize(service, spreadsheet_id, sheet_id, col_count)
+    all_requests: List[dict] = []
+    for sheet_id, row_count in ((active_id, active_rows), (completed_id, completed_rows)):
+        all_requests += _freeze_header(sheet_id)
+        all_requests += _basic_filter(sheet_id, row_count, col_count)
+        all_requests += _status_validation(sheet_id, row_count)
+        all_requests += _text_format_cols(sheet_id, row_count, TEXT_COL_RUNS)
+        all_requests += _bold_header_and_autosize(sheet_id, col_count)
+    all_requests += _store_cfg_hash(cfg_meta)
+    service.spreadsheets().batchUpdate(
+        spreadsheetId=spreadsheet_id, body={"requests": all_requests}
+    ).execute()
 
     print("Initialized sheets (classic setup):")
     print(f" - {ACTIVE_TAB} (sheetId={active_id})")
@@ -237,4 +323,4 @@ def ensure_trade_sheets() -> Tuple[int, int]:
 
 
 if __name__ == "__main__":
-    ensure_trade_sheets()
+    ensure_trade_sheets(force="--force" in sys.argv[1:])
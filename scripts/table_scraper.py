@@ -1,17 +1,31 @@
 #!/usr/bin/env python3
 # scripts/table_scraper.py
 
+import hashlib
 import json
+import os
+import re
 import sys
+import time
 import argparse
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
+import lxml.etree
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 URL = "https://arcraiders.wiki/wiki/Blueprints"
 
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "arctraiders"
+CACHE_TTL = 3600  # seconds a cached page is served without contacting the wiki
+
 # Map messy/variant headers -> clean snake_case keys
 HEADER_MAP = {
     "blueprint": "blueprint_name",
@@ -25,88 +39,191 @@ HEADER_MAP = {
     "trials reward": "trials_reward",
 }
 
-def fetch_html(url: str) -> str:
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; ArcScraper/1.0)"}
-    resp = requests.get(url, headers=headers, timeout=30)
-    resp.raise_for_status()
-    return resp.text
-
-def find_table(soup: BeautifulSoup):
+# One session for all fetches: keep-alive connection reuse + compressed transfers
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; ArcScraper/1.0)",
+    "Accept-Encoding": "gzip, deflate",
+})
+
+# Header lookup keyed by the normalized (casefolded) header text
+_HEADER_LOOKUP = {k.casefold(): v for k, v in HEADER_MAP.items()}
+_WS_RE = re.compile(r"\s+")
+
+# Compiled once; reused for every row of the table
+_TR = lxml.etree.XPath(".//tr")
+_TH = lxml.etree.XPath(".//th")
+_TD = lxml.etree.XPath(".//td")
+
+CHUNK_SIZE = 65536
+
+def _cache_paths(url: str) -> Tuple[Path, Path]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.html", CACHE_DIR / f"{key}.json"
+
+def _read_until_table(resp: requests.Response) -> Tuple[bytes, Optional[lxml.etree._Element]]:
+    """
+    Stream the body through an incremental parser and stop downloading as soon as
+    the Blueprint wikitable has closed. Returns the bytes received so far (for the
+    cache) and the table parsed on the way, so the page is parsed only once.
+    """
+    parser = lxml.etree.HTMLPullParser(events=("end",), tag="table")
+    chunks: List[bytes] = []
+    for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+        chunks.append(chunk)
+        parser.feed(chunk)
+        for _, table in parser.read_events():
+            if _is_wikitable(table) and _is_blueprint_table(table):
+                return b"".join(chunks), table
+    return b"".join(chunks), find_table(parser.close())
+
+def _table_from_bytes(html: bytes) -> lxml.etree._Element:
+    table = find_table(lxml.html.fromstring(html))
+    if table is None:
+        raise RuntimeError("Blueprints table not found")
+    return table
+
+def fetch_table(url: str, use_cache: bool = True, ttl: int = CACHE_TTL) -> lxml.etree._Element:
+    """
+    Fetch the page (up to the end of the Blueprint table) and return the table
+    element. Fresh pages come from the on-disk cache; stale entries are revalidated
+    with If-None-Match/If-Modified-Since and a 304 reuses the cached body.
+    """
+    body_path, meta_path = _cache_paths(url)
+    cached = use_cache and body_path.exists()
+    if cached and time.time() - body_path.stat().st_mtime < ttl:
+        return _table_from_bytes(body_path.read_bytes())
+
+    headers = {}
+    if cached and meta_path.exists():
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    with _SESSION.get(url, headers=headers, timeout=30, stream=True) as resp:
+        if cached and resp.status_code == 304:
+            body_path.touch()
+            return _table_from_bytes(body_path.read_bytes())
+        resp.raise_for_status()
+        # Raw (gzip-decoded) bytes: lxml detects the encoding itself, no str round-trip needed
+        content, table = _read_until_table(resp)
+        resp_headers = resp.headers
+
+    # Raise before caching: a page without the table (maintenance/error page) must not be
+    # served from the cache for the next ttl seconds
+    if table is None:
+        raise RuntimeError("Blueprints table not found")
+    if use_cache:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(content)
+        meta_path.write_text(json.dumps({
+            "url": url,
+            "etag": resp_headers.get("ETag"),
+            "last_modified": resp_headers.get("Last-Modified"),
+        }), encoding="utf-8")
+    return table
+
+def _is_wikitable(table) -> bool:
+    return "wikitable" in (table.get("class") or "").split()
+
+def _is_blueprint_table(table) -> bool:
+    # The Blueprint column is always first, so only the first <th> needs checking
+    first_th = table.find(".//th")
+    return first_th is not None and "Blueprint" in "".join(first_th.itertext())
+
+def find_table(doc: lxml.html.HtmlElement):
     # Prefer a wikitable whose header contains "Blueprint"
-    t = soup.select_one('table.wikitable:has(th:contains("Blueprint"))')
-    return t or soup.select_one("table.wikitable")
+    fallback = None
+    for table in doc.iter("table"):
+        if not _is_wikitable(table):
+            continue
+        if _is_blueprint_table(table):
+            return table
+        if fallback is None:
+            fallback = table
+    return fallback
 
 def clean_key(header: str) -> str:
-    h = " ".join(header.split()).strip().lower()
-    return HEADER_MAP.get(h, h.replace(" ", "_"))
+    h = _WS_RE.sub(" ", header).strip().casefold()
+    return _HEADER_LOOKUP.get(h) or h.replace(" ", "_")
 
 def cell_text(td) -> str:
-    # Preserve line breaks as spaces; strip refs/footnotes text
-    return td.get_text(" ", strip=True)
+    # Strip each text node and join the non-empty ones with a space (so "<br>"-separated
+    # lines and adjacent links stay apart), matching BeautifulSoup's get_text(" ", strip=True)
+    return " ".join(s for s in (x.strip() for x in td.itertext()) if s)
 
 def cell_link(td) -> Optional[str]:
-    a = td.find("a", href=True)
-    if not a:
+    hrefs = td.xpath(".//a[@href]/@href")[:1]
+    if not hrefs:
         return None
-    href = a["href"]
+    href = hrefs[0]
     if href.startswith("/"):
         return f"https://arcraiders.wiki{href}"
     return href
 
-def parse_table(html: str) -> List[Dict]:
-    soup = BeautifulSoup(html, "html.parser")
-    table = find_table(soup)
-    if not table:
-        raise RuntimeError("Blueprints table not found")
-
-    rows = table.select("tr")
+def parse_table(table: lxml.etree._Element) -> List[Dict]:
+    rows = _TR(table)
     if not rows:
         raise RuntimeError("Blueprints table has no rows")
 
     # Headers
-    raw_headers = [th.get_text(" ", strip=True) for th in rows[0].select("th")]
+    raw_headers = [cell_text(th) for th in _TH(rows[0])]
     headers = [clean_key(h) for h in raw_headers]
     n = len(headers)
 
+    headers_t = tuple(headers)
+    pad = [""] * n
+
     out: List[Dict] = []
-    for tr in rows[1:]:
-        tds = tr.select("td")
+    append = out.append
+    for tr in islice(rows, 1, None):
+        tds = _TD(tr)
         if not tds:
             continue
-        cells = [cell_text(td) for td in tds]
-        # normalize length to header count
-        if len(cells) < n:
-            cells += [""] * (n - len(cells))
-        elif len(cells) > n:
-            cells = cells[:n]
-
-        record = dict(zip(headers, cells))
+        # normalize length to header count (pad short rows, zip drops extras)
+        cells = [" ".join(s for s in (x.strip() for x in td.itertext()) if s) for td in tds]
+        record = dict(zip(headers_t, cells + pad if len(cells) < n else cells))
 
         # Try to capture a link for the blueprint (first column usually)
-        if headers and headers[0] in record:
+        if n:
             link = cell_link(tds[0])
             if link:
                 record["blueprint_url"] = link
 
-        out.append(record)
+        append(record)
 
     return out
 
+def extract_blueprint_names(entries: List[Dict]) -> List[str]:
+    # The first column (blueprint_name) is the first key of every record
+    return [next(iter(e.values())) for e in entries if e]
+
 def main():
     ap = argparse.ArgumentParser(description="Scrape ARC Raiders Blueprints table into JSON objects.")
     ap.add_argument("--url", default=URL, help="Source URL")
     ap.add_argument("-o", "--output", default="blueprints_full.json", help="Output JSON path")
+    ap.add_argument("--cache-ttl", type=int, default=CACHE_TTL,
+                    help="Seconds to reuse the cached page before revalidating")
+    ap.add_argument("--no-cache", action="store_true", help="Always fetch; do not read or write the cache")
+    ap.add_argument("--names-only", action="store_true", help="Write a list of blueprint names instead of full rows")
     args = ap.parse_args()
 
     try:
-        html = fetch_html(args.url)
-        entries = parse_table(html)
+        table = fetch_table(args.url, use_cache=not args.no_cache, ttl=args.cache_ttl)
+        entries = parse_table(table)
+        if args.names_only:
+            entries = extract_blueprint_names(entries)
 
-        # Write list[dict]
+        # Write list[dict] (or list[str] with --names-only)
         out_path = Path(args.output)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        with out_path.open("w", encoding="utf-8") as f:
-            json.dump(entries, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            out_path.write_bytes(orjson.dumps(entries, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with out_path.open("w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
 
         print(f"Wrote {len(entries)} rows to {out_path}")
     except Exception as e:
@@ -16,9 +16,17 @@ Tabs:
 """
 
 import os
-import uuid
-import datetime as dt
-from typing import List, Dict, Any, Optional, Tuple
+import re
+import asyncio
+import threading
+import time
+import bisect
+import collections
+import functools
+import heapq
+import random
+import itertools
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Callable
 
 # ----------------------------
 # Canonical schema / constants
@@ -40,16 +48,129 @@ STATUS_CANCELLED = "CANCELLED"
 
 STATUS_ALLOWED = [STATUS_OPEN, STATUS_ACCEPTED, STATUS_COMPLETED, STATUS_CANCELLED]
 
-STATUS_COL = 1  # 0-based index
-TIMESTAMP_COLS = [8, 9, 10]             # created_ts, accepted_ts, completed_ts
-ID_COLS = [0, 4, 6, 12, 13]             # offer_id, offerer_id, accepter_id, guild_id, channel_id
+# 0-based column positions, resolved once instead of HEADERS.index() per call
+HEADER_INDEX: Dict[str, int] = {h: i for i, h in enumerate(HEADERS)}
+COL_STATUS = HEADER_INDEX["status"]
+COL_ACCEPTER_ID = HEADER_INDEX["accepter_id"]
+COL_ACCEPTER_NAME = HEADER_INDEX["accepter_name"]
+COL_ACCEPTED_TS = HEADER_INDEX["accepted_ts"]
+COL_COMPLETED_TS = HEADER_INDEX["completed_ts"]
+
+TIMESTAMP_COLS = [HEADER_INDEX[h] for h in ("created_ts", "accepted_ts", "completed_ts")]
+ID_COLS = [HEADER_INDEX[h] for h in ("offer_id", "offerer_id", "accepter_id", "guild_id", "channel_id")]
+
+def _merge_runs(columns: Iterable[int]) -> List[Tuple[int, int]]:
+    """Collapse column indexes into contiguous [start, end) runs."""
+    runs: List[Tuple[int, int]] = []
+    for c in sorted(set(columns)):
+        if runs and runs[-1][1] == c:
+            runs[-1] = (runs[-1][0], c + 1)
+        else:
+            runs.append((c, c + 1))
+    return runs
+
+TEXT_COL_RUNS = _merge_runs(ID_COLS + TIMESTAMP_COLS)  # [(0, 1), (4, 5), (6, 7), (8, 11), (12, 14)]
+
+# Row-scoped developer metadata key used to locate an offer's row server-side
+OFFER_ID_METADATA_KEY = "offer_id"
+
+HTTP_TIMEOUT_S = 30  # socket timeout for Sheets API calls
+
+# HTTP statuses retried with exponential backoff. Rejected (429) requests were never
+# applied, so non-idempotent calls (appends, structural batchUpdates) retry only those.
+RETRY_STATUSES = (429, 500, 503)
+RATE_LIMIT_STATUSES = (429,)
+
+SWEEP_INTERVAL_S = 60.0  # minimum seconds between housekeeping sweeps per ledger
+
+READ_CACHE_TTL_S = 3.0  # how long SheetsBackend serves tab reads from memory
+
+# ----------------------------
+# Row type
+# ----------------------------
+
+class Row(collections.namedtuple("Row", HEADERS)):
+    """
+    One ledger row; fields follow HEADERS. Lighter than a dict per row, while
+    .get(name, default) and row["name"] keep dict-style call sites working.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_values(cls, values: List[Any]) -> "Row":
+        """Build from a raw sheet row, padding short rows and dropping extra cells."""
+        n = len(HEADERS)
+        if len(values) != n:
+            values = (list(values) + [""] * n)[:n]
+        return cls(*values)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, HEADER_INDEX[key])
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = "") -> Any:
+        i = HEADER_INDEX.get(key)
+        return default if i is None else tuple.__getitem__(self, i)
 
 # ----------------------------
 # Utilities
 # ----------------------------
 
+_LAST_TS_SEC: List[Any] = [0, ""]  # [epoch second, its formatted timestamp]
+
 def utcnow() -> str:
-    return dt.datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    """Current UTC time as "YYYY-MM-DDTHH:MM:SSZ"; formatted once per second."""
+    sec = int(time.time())
+    if sec != _LAST_TS_SEC[0]:
+        _LAST_TS_SEC[:] = [sec, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))]
+    return _LAST_TS_SEC[1]
+
+_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"  # Crockford alphabet; ASCII order == digit order
+# Randomly seeded so processes sharing the ledger don't start from the same counter value
+_ID_COUNTER = itertools.count(random.getrandbits(8))
+_LAST_ID: List[int] = [0]
+
+def _b32_encode(n: int, width: int) -> str:
+    chars = []
+    for _ in range(width):
+        n, r = divmod(n, 32)
+        chars.append(_BASE32[r])
+    return "".join(reversed(chars))
+
+def new_offer_id() -> str:
+    """
+    10-char time-ordered id: milliseconds since the epoch (42 bits) plus an 8-bit
+    counter, forced strictly increasing within the process. Ids sort by creation
+    time, so rows appended to Active keep column A in sorted order.
+
+    Unique within a process. Across processes the counter starts at a random value,
+    so two offers created in the same millisecond by different processes collide
+    with probability 1/256 -- low at this ledger's rate, but not zero.
+    """
+    n = (int(time.time() * 1000) << 8) | (next(_ID_COUNTER) & 0xFF)
+    n = max(n, _LAST_ID[0] + 1)
+    _LAST_ID[0] = n
+    return _b32_encode(n, 10)
+
+def _locate_id(ids: List[str], offer_id: str) -> Optional[int]:
+    """
+    Position of offer_id in a column of ids. Binary search first (time-ordered ids are
+    appended in sorted order); falls back to a linear search while older random ids remain.
+    """
+    i = bisect.bisect_left(ids, offer_id)
+    if i < len(ids) and ids[i] == offer_id:
+        return i
+    try:
+        return ids.index(offer_id)
+    except ValueError:
+        return None
+
+def _top_n(rows: Iterable[Row], n: int, key: Callable[[Row], str]) -> List[Row]:
+    """Largest n rows by key, descending (all rows when n < 0); same order as a stable reverse sort."""
+    if n < 0:
+        return sorted(rows, key=key, reverse=True)
+    return heapq.nlargest(n, rows, key=key)
 
 def col_a1(n: int) -> str:
     s = ""
@@ -58,24 +179,87 @@ def col_a1(n: int) -> str:
         s = chr(65 + r) + s
     return s
 
+# Column letters by 0-based index; the schema is fixed, so range strings index this
+# instead of calling col_a1(); _col_letter() falls back to col_a1() for anything wider.
+COL_LETTERS = tuple(col_a1(i) for i in range(1, 64))
+_LAST_COL = COL_LETTERS[len(HEADERS) - 1]
+
+def _col_letter(col_idx_0: int) -> str:
+    return COL_LETTERS[col_idx_0] if col_idx_0 < len(COL_LETTERS) else col_a1(col_idx_0 + 1)
+
+_A1_START_ROW = re.compile(r"!\$?[A-Z]*\$?(\d+)")
+
+def a1_start_row(rng: str) -> int:
+    """First row number of an A1 range such as "ActiveTrades!A5:N5" -> 5."""
+    return int(_A1_START_ROW.search(rng).group(1))
+
 # ----------------------------
 # Backend interface
 # ----------------------------
 
+def _row_values(row: Any) -> List[Any]:
+    """Padded cell list for a Row, a header-keyed dict (older backends) or a raw list."""
+    if isinstance(row, dict):
+        return [row.get(h, "") for h in HEADERS]
+    values = list(row)
+    return values + [""] * (len(HEADERS) - len(values))
+
+_IO_LOCK_GUARD = threading.Lock()
+
 class Backend:
+    @property
+    def io_lock(self) -> threading.RLock:
+        """
+        Reentrant lock serializing I/O on this backend (created on first use). SheetsBackend
+        holds it around every request; async ledger calls hold it for the whole operation.
+        """
+        with _IO_LOCK_GUARD:
+            lock = self.__dict__.get("_io_lock")
+            if lock is None:
+                lock = self.__dict__["_io_lock"] = threading.RLock()
+        return lock
+
     def ensure_initialized(self) -> None: ...
     def append_active(self, row: List[Any]) -> None: ...
     def update_active_cell(self, row_idx_1: int, col_idx_0: int, value: Any) -> None: ...
-    def read_active_row(self, row_idx_1: int) -> Dict[str, Any]: ...
+    def read_active_row(self, row_idx_1: int) -> Row: ...
     def find_active_row_index(self, offer_id: str) -> Optional[int]: ...
-    def read_active_all(self) -> List[Dict[str, Any]]: ...
+    def read_active_all(self) -> List[Row]: ...
     def append_completed(self, row: List[Any]) -> None: ...
     # --- cleanup support ---
     def read_active_rows_with_indices(self) -> List[Tuple[int, List[Any]]]: ...
     def append_completed_rows(self, rows: List[List[Any]]) -> None: ...
     def delete_active_rows(self, row_indices_1based: List[int]) -> None: ...
     # --- completed reading ---
-    def read_completed_all(self) -> List[Dict[str, Any]]: ...
+    def read_completed_all(self) -> List[Row]: ...
+
+    # Combined operations. The defaults are built from the primitives above, so a
+    # backend written against them keeps working; backends override these to save
+    # round trips.
+
+    def append_active_rows(self, rows: List[List[Any]]) -> None:
+        for row in rows:
+            self.append_active(row)
+
+    def update_active_cells(self, row_idx_1: int, updates: Dict[int, Any]) -> None:
+        for col_idx_0, value in updates.items():
+            self.update_active_cell(row_idx_1, col_idx_0, value)
+
+    def find_and_read(self, offer_id: str) -> Optional[Tuple[int, Row]]:
+        idx = self.find_active_row_index(offer_id)
+        if idx is None:
+            return None
+        row = self.read_active_row(idx)
+        return idx, row if isinstance(row, Row) else Row.from_values(_row_values(row))
+
+    def move_active_to_completed(self, rows: List[List[Any]], row_indices_1based: List[int]) -> None:
+        self.append_completed_rows(rows)
+        self.delete_active_rows(row_indices_1based)
+
+    def read_all_active_and_completed(self, fresh: bool = False) -> Tuple[List[List[Any]], List[List[Any]]]:
+        """Data rows of both tabs; fresh=True must bypass any read cache (rows drive deletes by index)."""
+        return ([_row_values(r) for r in self.read_active_all()],
+                [_row_values(r) for r in self.read_completed_all()])
 
 # ----------------------------
 # Memory backend (offline use)
@@ -85,31 +269,46 @@ class MemoryBackend(Backend):
     def __init__(self):
         self.active: List[List[Any]] = [HEADERS[:]]   # header row at index 0
         self.completed: List[List[Any]] = [HEADERS[:]]
+        self._index: Dict[str, int] = {}   # offer_id -> 1-based Active row (first occurrence)
 
     def ensure_initialized(self) -> None:
         pass
 
+    def _rebuild_index(self) -> None:
+        self._index = {}
+        for i, row in enumerate(self.active[1:], start=2):
+            if row:
+                self._index.setdefault(row[0], i)
+
     def append_active(self, row: List[Any]) -> None:
-        self.active.append(row)
+        self.append_active_rows([row])
+
+    def append_active_rows(self, rows: List[List[Any]]) -> None:
+        for row in rows:
+            self.active.append(row)
+            if row:
+                self._index.setdefault(row[0], len(self.active))
 
     def update_active_cell(self, row_idx_1: int, col_idx_0: int, value: Any) -> None:
-        self.active[row_idx_1 - 1][col_idx_0] = value
+        self.update_active_cells(row_idx_1, {col_idx_0: value})
+
+    def update_active_cells(self, row_idx_1: int, updates: Dict[int, Any]) -> None:
+        row = self.active[row_idx_1 - 1]
+        for col_idx_0, value in updates.items():
+            row[col_idx_0] = value
+        if 0 in updates:
+            self._rebuild_index()
 
-    def read_active_row(self, row_idx_1: int) -> Dict[str, Any]:
+    def read_active_row(self, row_idx_1: int) -> Row:
         row = self.active[row_idx_1 - 1]
-        return dict(zip(HEADERS, row))
+        return Row.from_values(row)
 
     def find_active_row_index(self, offer_id: str) -> Optional[int]:
-        for i, row in enumerate(self.active, start=1):
-            if i == 1:
-                continue
-            if row and row[0] == offer_id:
-                return i
-        return None
+        return self._index.get(offer_id)
 
-    def read_active_all(self) -> List[Dict[str, Any]]:
+    def read_active_all(self) -> List[Row]:
         rows = self.active[1:]
-        return [dict(zip(HEADERS, r)) for r in rows]
+        return [Row.from_values(r) for r in rows]
 
     def append_completed(self, row: List[Any]) -> None:
         self.completed.append(row)
@@ -127,106 +326,190 @@ class MemoryBackend(Backend):
             self.completed.append(r[:])
 
     def delete_active_rows(self, row_indices_1based: List[int]) -> None:
+        if not row_indices_1based:
+            return
         for idx in sorted(row_indices_1based, reverse=True):
             del self.active[idx - 1]
+        self._rebuild_index()
 
     # --- completed reading ---
 
-    def read_completed_all(self) -> List[Dict[str, Any]]:
+    def read_completed_all(self) -> List[Row]:
         rows = self.completed[1:]
-        return [dict(zip(HEADERS, r)) for r in rows]
+        return [Row.from_values(r) for r in rows]
+
+    def read_all_active_and_completed(self, fresh: bool = False) -> Tuple[List[List[Any]], List[List[Any]]]:
+        def padded(rows: List[List[Any]]) -> List[List[Any]]:
+            return [r + [""] * (len(HEADERS) - len(r)) for r in rows]
+        return padded(self.active[1:]), padded(self.completed[1:])
 
 # ----------------------------
 # Google Sheets backend
 # ----------------------------
 
+def _exec_with_retry(request: Any, attempts: int = 6,
+                     statuses: Tuple[int, ...] = RETRY_STATUSES,
+                     lock: Optional[threading.RLock] = None) -> Any:
+    """
+    Execute a googleapiclient request, backing off exponentially (with jitter) on statuses.
+    When lock is given it is held for each attempt, but not while sleeping between them.
+    """
+    from googleapiclient.errors import HttpError
+
+    for i in range(attempts):
+        try:
+            if lock is None:
+                return request.execute()
+            with lock:
+                return request.execute()
+        except HttpError as e:
+            if e.resp.status not in statuses or i == attempts - 1:
+                raise
+            time.sleep((2 ** i) * 0.25 + random.random() * 0.25)
+
 class SheetsBackend(Backend):
     def __init__(self):
         self.sa_path = os.getenv("GOOGLE_SA_JSON_PATH", "./service_account.json")
         self.spreadsheet_id = os.getenv("GOOGLE_SHEET_ID", "").strip()
         if not self.spreadsheet_id:
             raise RuntimeError("GOOGLE_SHEET_ID must be set for Sheets backend.")
+        import httplib2
         from google.oauth2.service_account import Credentials
+        from google_auth_httplib2 import AuthorizedHttp
         from googleapiclient.discovery import build
 
         scopes = ["https://www.googleapis.com/auth/spreadsheets"]
         creds = Credentials.from_service_account_file(self.sa_path, scopes=scopes)
-        self.service = build("sheets", "v4", credentials=creds)
+        # One authorized transport for every call made by this backend; httplib2 keeps
+        # the TLS connection to the API host open between requests.
+        http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT_S))
+        # Bundled discovery doc: no HTTPS fetch of the Sheets API description at startup
+        self.service = build("sheets", "v4", http=http, static_discovery=True, cache_discovery=False)
+        # title -> sheetId; sheet ids are stable for the life of the process
+        self._sheet_map_cache: Optional[Dict[str, int]] = None
+        self._initialized = False
+        # tab -> (monotonic fetch time, padded data rows); busted by every mutation
+        self._read_cache: Dict[str, Tuple[float, List[List[Any]]]] = {}
+
+    def _execute(self, request: Any, statuses: Tuple[int, ...] = RETRY_STATUSES) -> Any:
+        # The shared httplib2 transport is not thread-safe: every request takes io_lock,
+        # whichever ledger or thread issues it
+        return _exec_with_retry(request, statuses=statuses, lock=self.io_lock)
 
     # --- Setup helpers ---
 
     def _get_sheet_map(self) -> Dict[str, int]:
-        meta = self.service.spreadsheets().get(spreadsheetId=self.spreadsheet_id).execute()
-        return {s["properties"]["title"]: s["properties"]["sheetId"] for s in meta.get("sheets", [])}
+        if self._sheet_map_cache is None:
+            meta = self._execute(self.service.spreadsheets().get(spreadsheetId=self.spreadsheet_id))
+            self._sheet_map_cache = {
+                s["properties"]["title"]: s["properties"]["sheetId"] for s in meta.get("sheets", [])
+            }
+        return self._sheet_map_cache
+
+    def _invalidate_sheet_map(self) -> None:
+        """Drop the cached title -> sheetId map (call after deleting/recreating a tab)."""
+        self._sheet_map_cache = None
+
+    # --- Read cache ---
+
+    def _cache_get(self, tab: str) -> Optional[List[List[Any]]]:
+        hit = self._read_cache.get(tab)
+        if hit is not None and time.monotonic() - hit[0] < READ_CACHE_TTL_S:
+            return hit[1]
+        return None
+
+    def _cache_put(self, tab: str, rows: List[List[Any]]) -> List[List[Any]]:
+        self._read_cache[tab] = (time.monotonic(), rows)
+        return rows
+
+    def _cached_read(self, tab: str, fetcher: Callable[[], List[List[Any]]]) -> List[List[Any]]:
+        """Rows of tab from the cache if younger than READ_CACHE_TTL_S, else from fetcher()."""
+        rows = self._cache_get(tab)
+        return rows if rows is not None else self._cache_put(tab, fetcher())
+
+    def _bust_read_cache(self, *tabs: str) -> None:
+        for tab in tabs:
+            self._read_cache.pop(tab, None)
+
+    def _fetch_tab_rows(self, tab: str) -> List[List[Any]]:
+        rng = f"{tab}!A2:{_LAST_COL}"
+        val = self._execute(self.service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=rng))
+        return [r + [""] * (len(HEADERS) - len(r)) for r in val.get("values", [])]
 
-    def _add_sheet_if_missing(self, title: str, cols: int) -> int:
+    def _add_sheets_if_missing(self, titles_and_cols: List[Tuple[str, int]]) -> Dict[str, int]:
+        """Add every missing tab in one batchUpdate; new ids go straight into the cached map."""
         sheet_map = self._get_sheet_map()
-        if title in sheet_map:
-            return sheet_map[title]
-        reqs = [{"addSheet": {"properties": {"title": title, "gridProperties": {"rowCount": 1000, "columnCount": cols}}}}]
-        resp = self.service.spreadsheets().batchUpdate(
-            spreadsheetId=self.spreadsheet_id, body={"requests": reqs}
-        ).execute()
-        return resp["replies"][0]["addSheet"]["properties"]["sheetId"]
-
-    def _read_row_1(self, title: str) -> List[str]:
-        rng = f"{title}!1:1"
-        val = self.service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=rng).execute()
-        values = val.get("values", [])
-        return values[0] if values else []
-
-    def _write_headers_strict(self, title: str) -> None:
-        row1 = self._read_row_1(title)
-        if row1 != HEADERS:
-            rng = f"{title}!A1:{col_a1(len(HEADERS))}1"
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.spreadsheet_id,
-                range=rng,
-                valueInputOption="RAW",
-                body={"values": [HEADERS]},
-            ).execute()
-
-    def _freeze_header(self, sheet_id: int):
-        reqs = [{"updateSheetProperties": {
+        reqs = [{"addSheet": {"properties": {"title": title, "gridProperties": {"rowCount": 1000, "columnCount": cols}}}}
+                for title, cols in titles_and_cols if title not in sheet_map]
+        if reqs:
+            resp = self._execute(self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id, body={"requests": reqs}
+            ), statuses=RATE_LIMIT_STATUSES)
+            for reply in resp["replies"]:
+                props = reply["addSheet"]["properties"]
+                sheet_map[props["title"]] = props["sheetId"]
+        return sheet_map
+
+    def _read_rows_1_batch(self, titles: List[str]) -> Dict[str, List[str]]:
+        """Read row 1 of several tabs with one values.batchGet."""
+        val = self._execute(self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id, ranges=[f"{t}!1:1" for t in titles]
+        ))
+        out: Dict[str, List[str]] = {}
+        for title, value_range in zip(titles, val.get("valueRanges", [])):
+            values = value_range.get("values", [])
+            out[title] = values[0] if values else []
+        return out
+
+    # Setup helpers return batchUpdate sub-requests; ensure_initialized sends them together.
+
+    def _write_headers_strict(self, sheet_id: int) -> List[Dict[str, Any]]:
+        return [{"updateCells": {
+            "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+            "rows": [{"values": [{"userEnteredValue": {"stringValue": h}} for h in HEADERS]}],
+            "fields": "userEnteredValue",
+        }}]
+
+    def _freeze_header(self, sheet_id: int) -> List[Dict[str, Any]]:
+        return [{"updateSheetProperties": {
             "properties": {"sheetId": sheet_id, "gridProperties": {"frozenRowCount": 1}},
             "fields": "gridProperties.frozenRowCount"
         }}]
-        self.service.spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id, body={"requests": reqs}).execute()
 
-    def _basic_filter(self, sheet_id: int, col_count: int):
-        reqs = [{"setBasicFilter": {"filter": {
+    def _basic_filter(self, sheet_id: int, col_count: int) -> List[Dict[str, Any]]:
+        return [{"setBasicFilter": {"filter": {
             "range": {"sheetId": sheet_id, "startRowIndex": 0, "endRowIndex": 10000, "startColumnIndex": 0, "endColumnIndex": col_count}
         }}}]
-        self.service.spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id, body={"requests": reqs}).execute()
 
-    def _text_format_cols(self, sheet_id: int, columns: List[int]):
+    def _text_format_cols(self, sheet_id: int, runs: List[Tuple[int, int]]) -> List[Dict[str, Any]]:
+        # One repeatCell per contiguous run of columns; no endRowIndex, so the format
+        # covers every row below the header, including rows appended later
         reqs = []
-        for c in columns:
+        for start, end in runs:
             reqs.append({
                 "repeatCell": {
-                    "range": {"sheetId": sheet_id, "startRowIndex": 1, "endRowIndex": 10000,
-                              "startColumnIndex": c, "endColumnIndex": c + 1},
+                    "range": {"sheetId": sheet_id, "startRowIndex": 1,
+                              "startColumnIndex": start, "endColumnIndex": end},
                     "cell": {"userEnteredFormat": {"numberFormat": {"type": "TEXT"}}},
                     "fields": "userEnteredFormat.numberFormat"
                 }
             })
-        self.service.spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id, body={"requests": reqs}).execute()
+        return reqs
 
-    def _status_validation(self, sheet_id: int):
-        reqs = [{
+    def _status_validation(self, sheet_id: int) -> List[Dict[str, Any]]:
+        return [{
             "repeatCell": {
                 "range": {"sheetId": sheet_id, "startRowIndex": 1, "endRowIndex": 10000,
-                          "startColumnIndex": STATUS_COL, "endColumnIndex": STATUS_COL + 1},
+                          "startColumnIndex": COL_STATUS, "endColumnIndex": COL_STATUS + 1},
                 "cell": {"dataValidation": {"condition": {
                     "type": "ONE_OF_LIST", "values": [{"userEnteredValue": v} for v in STATUS_ALLOWED]
                 }, "strict": True, "showCustomUi": True}},
                 "fields": "dataValidation"
             }
         }]
-        self.service.spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id, body={"requests": reqs}).execute()
 
-    def _bold_header_and_autosize(self, sheet_id: int, col_count: int):
-        reqs = [
+    def _bold_header_and_autosize(self, sheet_id: int, col_count: int) -> List[Dict[str, Any]]:
+        return [
             {"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": 0, "endRowIndex": 1,
                                       "startColumnIndex": 0, "endColumnIndex": col_count},
                             "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
@@ -234,95 +517,167 @@ class SheetsBackend(Backend):
             {"autoResizeDimensions": {"dimensions": {"sheetId": sheet_id, "dimension": "COLUMNS",
                                                      "startIndex": 0, "endIndex": col_count}}}
         ]
-        self.service.spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id, body={"requests": reqs}).execute()
 
     # --- Backend interface ---
 
     def ensure_initialized(self) -> None:
+        if self._initialized:
+            return
         col_count = len(HEADERS)
-        active_id = self._add_sheet_if_missing(ACTIVE_TAB, col_count)
-        completed_id = self._add_sheet_if_missing(COMPLETED_TAB, col_count)
-        self._write_headers_strict(ACTIVE_TAB)
-        self._write_headers_strict(COMPLETED_TAB)
+        sheet_map = self._add_sheets_if_missing([(ACTIVE_TAB, col_count), (COMPLETED_TAB, col_count)])
+        active_id, completed_id = sheet_map[ACTIVE_TAB], sheet_map[COMPLETED_TAB]
+        row1 = self._read_rows_1_batch([ACTIVE_TAB, COMPLETED_TAB])
+        all_requests: List[Dict[str, Any]] = []
+        for title, sid in ((ACTIVE_TAB, active_id), (COMPLETED_TAB, completed_id)):
+            if row1[title] != HEADERS:
+                all_requests += self._write_headers_strict(sid)
         for sid in (active_id, completed_id):
-            self._freeze_header(sid)
-            self._basic_filter(sid, col_count)
-            self._status_validation(sid)
-            self._text_format_cols(sid, list(set(ID_COLS + TIMESTAMP_COLS)))
-            self._bold_header_and_autosize(sid, col_count)
+            all_requests += self._freeze_header(sid)
+            all_requests += self._basic_filter(sid, col_count)
+            all_requests += self._status_validation(sid)
+            all_requests += self._text_format_cols(sid, TEXT_COL_RUNS)
+            all_requests += self._bold_header_and_autosize(sid, col_count)
+        self._execute(self.service.spreadsheets().batchUpdate(
+            spreadsheetId=self.spreadsheet_id, body={"requests": all_requests}
+        ), statuses=RATE_LIMIT_STATUSES)
+        self._initialized = True
 
     def append_active(self, row: List[Any]) -> None:
+        self.append_active_rows([row])
+
+    def append_active_rows(self, rows: List[List[Any]]) -> None:
+        """
+        Append rows to Active with one values.append, then tag them in one batchUpdate.
+        Tagging is best-effort: the rows are already written, and untagged rows are
+        still found by the column-A fallback in find_and_read.
+        """
+        from googleapiclient.errors import HttpError
+
+        if not rows:
+            return
+        self._bust_read_cache(ACTIVE_TAB)
         rng = f"{ACTIVE_TAB}!A:A"
-        self.service.spreadsheets().values().append(
+        resp = self._execute(self.service.spreadsheets().values().append(
             spreadsheetId=self.spreadsheet_id,
             range=rng, valueInputOption="RAW", insertDataOption="INSERT_ROWS",
-            body={"values": [row]}
-        ).execute()
+            body={"values": rows}
+        ), statuses=RATE_LIMIT_STATUSES)
+        try:
+            self._tag_offer_rows([r[0] for r in rows], a1_start_row(resp["updates"]["updatedRange"]))
+        except HttpError:
+            pass
+
+    def _tag_offer_rows(self, offer_ids: List[str], first_row_idx_1: int) -> None:
+        """
+        Attach row-scoped developer metadata (offer_id -> row) to consecutive rows
+        starting at first_row_idx_1, so lookups are a server-side index search;
+        Sheets keeps it attached as rows shift.
+        """
+        sheet_id = self._get_sheet_map()[ACTIVE_TAB]
+        reqs = [{"createDeveloperMetadata": {"developerMetadata": {
+            "metadataKey": OFFER_ID_METADATA_KEY,
+            "metadataValue": offer_id,
+            "location": {"dimensionRange": {
+                "sheetId": sheet_id, "dimension": "ROWS",
+                "startIndex": row_idx_1 - 1, "endIndex": row_idx_1,
+            }},
+            "visibility": "DOCUMENT",
+        }}} for row_idx_1, offer_id in enumerate(offer_ids, start=first_row_idx_1)]
+        self._execute(self.service.spreadsheets().batchUpdate(
+            spreadsheetId=self.spreadsheet_id, body={"requests": reqs}
+        ), statuses=RATE_LIMIT_STATUSES)
+
+    def _offer_lookup_filter(self, offer_id: str) -> Dict[str, Any]:
+        return {"developerMetadataLookup": {
+            "metadataKey": OFFER_ID_METADATA_KEY, "metadataValue": offer_id,
+        }}
 
     def update_active_cell(self, row_idx_1: int, col_idx_0: int, value: Any) -> None:
-        cell = f"{ACTIVE_TAB}!{col_a1(col_idx_0 + 1)}{row_idx_1}"
-        self.service.spreadsheets().values().update(
+        self._bust_read_cache(ACTIVE_TAB)
+        cell = f"{ACTIVE_TAB}!{_col_letter(col_idx_0)}{row_idx_1}"
+        self._execute(self.service.spreadsheets().values().update(
             spreadsheetId=self.spreadsheet_id, range=cell, valueInputOption="RAW",
             body={"values": [[value]]}
-        ).execute()
+        ))
+
+    def update_active_cells(self, row_idx_1: int, updates: Dict[int, Any]) -> None:
+        """Write several cells of one Active row in a single values.batchUpdate."""
+        self._bust_read_cache(ACTIVE_TAB)
+        data = [
+            {"range": f"{ACTIVE_TAB}!{_col_letter(c)}{row_idx_1}", "values": [[v]]}
+            for c, v in updates.items()
+        ]
+        self._execute(self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={"valueInputOption": "RAW", "data": data}
+        ))
 
-    def read_active_row(self, row_idx_1: int) -> Dict[str, Any]:
-        rng = f"{ACTIVE_TAB}!A{row_idx_1}:{col_a1(len(HEADERS))}{row_idx_1}"
-        val = self.service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=rng).execute()
+    def read_active_row(self, row_idx_1: int) -> Row:
+        rng = f"{ACTIVE_TAB}!A{row_idx_1}:{_LAST_COL}{row_idx_1}"
+        val = self._execute(self.service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=rng))
         row = val.get("values", [[]])[0]
-        return dict(zip(HEADERS, row))
+        return Row.from_values(row)
 
     def find_active_row_index(self, offer_id: str) -> Optional[int]:
-        rng = f"{ACTIVE_TAB}!A:A"
-        val = self.service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=rng).execute()
-        values = val.get("values", [])
-        for i, row in enumerate(values, start=1):
-            if row and row[0] == offer_id:
-                return i
-        return None
-
-    def read_active_all(self) -> List[Dict[str, Any]]:
-        rng = f"{ACTIVE_TAB}!A2:{col_a1(len(HEADERS))}"
-        val = self.service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=rng).execute()
+        # find_and_read checks column A against offer_id, so a tag that landed on the
+        # wrong row (rows shifted between append and tag) is never trusted
+        found = self.find_and_read(offer_id)
+        return None if found is None else found[0]
+
+    def find_and_read(self, offer_id: str) -> Optional[Tuple[int, Row]]:
+        """Locate and read an Active row in one request via its offer_id metadata tag."""
+        resp = self._execute(self.service.spreadsheets().values().batchGetByDataFilter(
+            spreadsheetId=self.spreadsheet_id,
+            body={"dataFilters": [self._offer_lookup_filter(offer_id)], "majorDimension": "ROWS"},
+        ))
+        for matched in resp.get("valueRanges", []):
+            value_range = matched.get("valueRange", {})
+            rng = value_range.get("range", "")
+            row = (value_range.get("values") or [[]])[0]
+            if rng.split("!")[0].strip("'") == ACTIVE_TAB and row and row[0] == offer_id:
+                return a1_start_row(rng), Row.from_values(row)
+        # Untagged rows (appended before offers were tagged): search the tab by column A
+        rng = f"{ACTIVE_TAB}!A2:{_LAST_COL}"
+        val = self._execute(self.service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=rng))
         rows = val.get("values", [])
-        return [dict(zip(HEADERS, r)) for r in rows]
+        pos = _locate_id([r[0] if r else "" for r in rows], offer_id)
+        return None if pos is None else (pos + 2, Row.from_values(rows[pos]))
+
+    def read_active_all(self) -> List[Row]:
+        rows = self._cached_read(ACTIVE_TAB, lambda: self._fetch_tab_rows(ACTIVE_TAB))
+        return [Row.from_values(r) for r in rows]
 
     def append_completed(self, row: List[Any]) -> None:
+        self._bust_read_cache(COMPLETED_TAB)
         rng = f"{COMPLETED_TAB}!A:A"
-        self.service.spreadsheets().values().append(
+        self._execute(self.service.spreadsheets().values().append(
             spreadsheetId=self.spreadsheet_id,
             range=rng, valueInputOption="RAW", insertDataOption="INSERT_ROWS",
             body={"values": [row]}
-        ).execute()
+        ), statuses=RATE_LIMIT_STATUSES)
 
     # --- cleanup support ---
 
     def read_active_rows_with_indices(self) -> List[Tuple[int, List[Any]]]:
-        rng = f"{ACTIVE_TAB}!A2:{col_a1(len(HEADERS))}"
-        val = self.service.spreadsheets().values().get(
-            spreadsheetId=self.spreadsheet_id, range=rng
-        ).execute()
-        rows = val.get("values", [])
-        out: List[Tuple[int, List[Any]]] = []
-        for offset, r in enumerate(rows, start=2):
-            out.append((offset, r + [""] * (len(HEADERS) - len(r))))
-        return out
+        return list(enumerate(self._fetch_tab_rows(ACTIVE_TAB), start=2))
 
     def append_completed_rows(self, rows: List[List[Any]]) -> None:
         if not rows:
             return
+        self._bust_read_cache(COMPLETED_TAB)
         rng = f"{COMPLETED_TAB}!A:A"
-        self.service.spreadsheets().values().append(
+        self._execute(self.service.spreadsheets().values().append(
             spreadsheetId=self.spreadsheet_id,
             range=rng,
             valueInputOption="RAW",
             insertDataOption="INSERT_ROWS",
             body={"values": rows},
-        ).execute()
+        ), statuses=RATE_LIMIT_STATUSES)
 
     def delete_active_rows(self, row_indices_1based: List[int]) -> None:
         if not row_indices_1based:
             return
+        self._bust_read_cache(ACTIVE_TAB)
         requests = []
         sheet_id = self._get_sheet_map()[ACTIVE_TAB]
         for idx in sorted(row_indices_1based, reverse=True):
@@ -336,18 +691,78 @@ class SheetsBackend(Backend):
                     }
                 }
             })
-        self.service.spreadsheets().batchUpdate(
+        self._execute(self.service.spreadsheets().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={"requests": requests}
+        ), statuses=RATE_LIMIT_STATUSES)
+
+    def move_active_to_completed(self, rows: List[List[Any]], row_indices_1based: List[int]) -> None:
+        """
+        Append rows to Completed and delete their Active rows in a single batchUpdate,
+        which Sheets applies atomically (no duplicates if the process dies midway).
+        Uses appendCells rather than copyPaste so no Completed read is needed to find
+        the destination row.
+        """
+        if not rows and not row_indices_1based:
+            return
+        self._bust_read_cache(ACTIVE_TAB, COMPLETED_TAB)
+        sheet_map = self._get_sheet_map()
+        requests: List[Dict[str, Any]] = []
+        if rows:
+            requests.append({"appendCells": {
+                "sheetId": sheet_map[COMPLETED_TAB],
+                "rows": [{"values": [{"userEnteredValue": {"stringValue": str(v)}} for v in r]} for r in rows],
+                "fields": "userEnteredValue",
+            }})
+        for idx in sorted(row_indices_1based, reverse=True):
+            requests.append({
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": sheet_map[ACTIVE_TAB],
+                        "dimension": "ROWS",
+                        "startIndex": idx - 1,
+                        "endIndex": idx
+                    }
+                }
+            })
+        self._execute(self.service.spreadsheets().batchUpdate(
             spreadsheetId=self.spreadsheet_id,
             body={"requests": requests}
-        ).execute()
+        ), statuses=RATE_LIMIT_STATUSES)
 
     # --- completed reading ---
 
-    def read_completed_all(self) -> List[Dict[str, Any]]:
-        rng = f"{COMPLETED_TAB}!A2:{col_a1(len(HEADERS))}"
-        val = self.service.spreadsheets().values().get(spreadsheetId=self.spreadsheet_id, range=rng).execute()
-        rows = val.get("values", [])
-        return [dict(zip(HEADERS, r)) for r in rows]
+    def read_completed_all(self) -> List[Row]:
+        rows = self._cached_read(COMPLETED_TAB, lambda: self._fetch_tab_rows(COMPLETED_TAB))
+        return [Row.from_values(r) for r in rows]
+
+    def read_all_active_and_completed(self, fresh: bool = False) -> Tuple[List[List[Any]], List[List[Any]]]:
+        """
+        Data rows (padded to HEADERS) of both tabs from a single values.batchGet,
+        or from the read cache when both tabs are fresh there and fresh is False.
+        Pass fresh=True when the Active rows will drive deletes by row index.
+        """
+        if not fresh:
+            active, completed = self._cache_get(ACTIVE_TAB), self._cache_get(COMPLETED_TAB)
+            if active is not None and completed is not None:
+                return active, completed
+        ranges = [f"{ACTIVE_TAB}!A2:{_LAST_COL}", f"{COMPLETED_TAB}!A2:{_LAST_COL}"]
+        val = self._execute(self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id, ranges=ranges
+        ))
+        active, completed = (
+            [r + [""] * (len(HEADERS) - len(r)) for r in vr.get("values", [])]
+            for vr in val.get("valueRanges", [{}, {}])
+        )
+        return self._cache_put(ACTIVE_TAB, active), self._cache_put(COMPLETED_TAB, completed)
+
+@functools.lru_cache(maxsize=None)
+def shared_sheets_backend() -> SheetsBackend:
+    """
+    Process-wide SheetsBackend, so every ledger reuses one credentials object,
+    HTTP connection, sheet-id cache and setup pass. Env is read on first use.
+    """
+    return SheetsBackend()
 
 # ----------------------------
 # TradeLedger orchestrator
@@ -359,71 +774,99 @@ class TradeLedger:
             self.backend = backend
         else:
             mode = os.getenv("ARC_BACKEND", "sheets").lower()
-            self.backend = MemoryBackend() if mode == "memory" else SheetsBackend()
+            self.backend = MemoryBackend() if mode == "memory" else shared_sheets_backend()
         self.backend.ensure_initialized()
+        self._last_sweep_ts: Optional[float] = None
 
     # --- temporary housekeeping hook ---
-    def _sweep_active_to_completed(self) -> None:
+    def _sweep_due(self) -> bool:
+        return self._last_sweep_ts is None or time.monotonic() - self._last_sweep_ts >= SWEEP_INTERVAL_S
+
+    def _sweep_active_to_completed(self, rows_with_idx: Optional[List[Tuple[int, List[Any]]]] = None) -> None:
         """
         Move any COMPLETED and CANCELLED rows that still linger in ActiveTrades to CompletedTrades.
-        Safe, idempotent. Called before/after actions until formal flow is added.
+        Safe, idempotent. Called before actions until formal flow is added, but runs at most
+        once per SWEEP_INTERVAL_S; in between, recent() still folds lingering rows into its view.
+        Pass rows_with_idx when the Active rows were already read to avoid another fetch;
+        they must come from an uncached read, since rows are deleted by index.
         """
+        if not self._sweep_due():
+            return
+        self._last_sweep_ts = time.monotonic()
         try:
-            self.cleanup(include_cancelled=True)
+            if rows_with_idx is None:
+                rows_with_idx = self.backend.read_active_rows_with_indices()
+            self._cleanup_rows(rows_with_idx, include_cancelled=True)
         except Exception:
             pass
 
-    def offer(self, offerer_id: str, offerer_name: str, item_raw: str,
-              qty: int = 1, notes: str = "", guild_id: str = "", channel_id: str = "") -> str:
-        self._sweep_active_to_completed()
+    @staticmethod
+    def _new_offer_row(offerer_id: str, offerer_name: str, item_raw: str,
+                       qty: int = 1, notes: str = "", guild_id: str = "", channel_id: str = "",
+                       now: Optional[str] = None) -> List[Any]:
         if qty <= 0:
             raise ValueError("qty must be positive")
-        offer_id = str(uuid.uuid4())[:8]
-        now = utcnow()
-        row = [
-            offer_id, STATUS_OPEN, item_raw, item_raw,
+        return [
+            new_offer_id(), STATUS_OPEN, item_raw, item_raw,
             str(offerer_id), str(offerer_name), "", "",
-            now, "", "",
+            now or utcnow(), "", "",
             notes, str(guild_id), str(channel_id),
         ]
+
+    def offer(self, offerer_id: str, offerer_name: str, item_raw: str,
+              qty: int = 1, notes: str = "", guild_id: str = "", channel_id: str = "") -> str:
+        self._sweep_active_to_completed()
+        row = self._new_offer_row(offerer_id, offerer_name, item_raw, qty, notes, guild_id, channel_id)
         self.backend.append_active(row)
+        return row[0]
+
+    def offer_many(self, items: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Create several offers with a single append. Each item holds offer()'s keyword
+        arguments; all are validated before anything is written. Returns the offer ids
+        in input order.
+        """
         self._sweep_active_to_completed()
-        return offer_id
+        now = utcnow()
+        rows = [self._new_offer_row(now=now, **item) for item in items]
+        self.backend.append_active_rows(rows)
+        return [r[0] for r in rows]
 
     def accept(self, offer_id: str, accepter_id: str, accepter_name: str) -> bool:
         self._sweep_active_to_completed()
-        idx = self.backend.find_active_row_index(offer_id)
-        if not idx:
+        found = self.backend.find_and_read(offer_id)
+        if not found:
             return False
-        row = self.backend.read_active_row(idx)
-        if row.get("status") != STATUS_OPEN:
+        idx, row = found
+        if row.status != STATUS_OPEN:
             return False
         now = utcnow()
-        self.backend.update_active_cell(idx, HEADERS.index("status"), STATUS_ACCEPTED)
-        self.backend.update_active_cell(idx, HEADERS.index("accepter_id"), str(accepter_id))
-        self.backend.update_active_cell(idx, HEADERS.index("accepter_name"), str(accepter_name))
-        self.backend.update_active_cell(idx, HEADERS.index("accepted_ts"), now)
-        self._sweep_active_to_completed()
+        self.backend.update_active_cells(idx, {
+            COL_STATUS: STATUS_ACCEPTED,
+            COL_ACCEPTER_ID: str(accepter_id),
+            COL_ACCEPTER_NAME: str(accepter_name),
+            COL_ACCEPTED_TS: now,
+        })
         return True
 
     def complete(self, offer_id: str) -> bool:
         self._sweep_active_to_completed()
-        idx = self.backend.find_active_row_index(offer_id)
-        if not idx:
+        found = self.backend.find_and_read(offer_id)
+        if not found:
             return False
-        row = self.backend.read_active_row(idx)
-        if row.get("status") not in (STATUS_ACCEPTED, STATUS_OPEN):
+        idx, row = found
+        if row.status not in (STATUS_ACCEPTED, STATUS_OPEN):
             return False
         now = utcnow()
-        self.backend.update_active_cell(idx, HEADERS.index("status"), STATUS_COMPLETED)
-        self.backend.update_active_cell(idx, HEADERS.index("completed_ts"), now)
-        row["status"] = STATUS_COMPLETED
-        row["completed_ts"] = now
-        self.backend.append_completed([row.get(h, "") for h in HEADERS])
-        self._sweep_active_to_completed()
+        self.backend.update_active_cells(idx, {
+            COL_STATUS: STATUS_COMPLETED,
+            COL_COMPLETED_TS: now,
+        })
+        row = row._replace(status=STATUS_COMPLETED, completed_ts=now)
+        self.backend.append_completed(list(row))
         return True
 
-    def last(self, n: int = 5) -> List[Dict[str, Any]]:
+    def last(self, n: int = 5) -> List[Row]:
         """
         Backward-compatible: return the last N 'in-progress' (ActiveTrades) by created_ts.
         Prefer using recent() for split views.
@@ -431,35 +874,36 @@ class TradeLedger:
         view = self.recent(n_active=n, n_completed=0)
         return view["in_progress"]
 
-    def recent(self, n_active: int = 5, n_completed: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+    def recent(self, n_active: int = 5, n_completed: int = 5) -> Dict[str, List[Row]]:
         """
         Return a split view:
           - in_progress: OPEN/ACCEPTED from ActiveTrades, sorted by created_ts desc
           - completed:   COMPLETED/CANCELLED from CompletedTrades (and any lingering in ActiveTrades),
                         sorted by completed_ts desc
 
-        The method also sweeps to ensure ActiveTrades is tidy before reading.
+        Both tabs are read in one call; when a sweep is due that read bypasses the backend's
+        read cache and the sweep reuses its rows.
         """
-        self._sweep_active_to_completed()
+        sweep = self._sweep_due()
+        active_raw, completed_raw = self.backend.read_all_active_and_completed(fresh=sweep)
+        if sweep:
+            # Anything the sweep moves is folded back in below as lingering_done
+            self._sweep_active_to_completed(list(enumerate(active_raw, start=2)))
 
         # In-progress from Active
-        active_rows = self.backend.read_active_all()
-        in_progress = [r for r in active_rows if (r.get("status") in (STATUS_OPEN, STATUS_ACCEPTED))]
-        in_progress.sort(key=lambda r: r.get("created_ts", ""), reverse=True)
-        if n_active >= 0:
-            in_progress = in_progress[:n_active]
+        in_progress_iter = (Row.from_values(r) for r in active_raw
+                            if r[COL_STATUS] in (STATUS_OPEN, STATUS_ACCEPTED))
+        in_progress = _top_n(in_progress_iter, n_active, key=lambda r: r.created_ts)
 
         # Completed primarily from Completed tab
-        completed_rows = self.backend.read_completed_all()
+        completed_rows = [Row.from_values(r) for r in completed_raw]
         # Guard: if anything still in Active is completed/cancelled, fold it in (should be rare post-sweep)
-        lingering_done = [r for r in active_rows if (r.get("status") in (STATUS_COMPLETED, STATUS_CANCELLED))]
-        completed_all = completed_rows + lingering_done
+        lingering_done = (Row.from_values(r) for r in active_raw
+                          if r[COL_STATUS] in (STATUS_COMPLETED, STATUS_CANCELLED))
         # Prefer completed_ts, fallback to accepted_ts/created_ts chain
-        def completed_key(r: Dict[str, Any]) -> str:
-            return r.get("completed_ts") or r.get("accepted_ts") or r.get("created_ts") or ""
-        completed_all.sort(key=completed_key, reverse=True)
-        if n_completed >= 0:
-            completed_all = completed_all[:n_completed]
+        def completed_key(r: Row) -> str:
+            return r.completed_ts or r.accepted_ts or r.created_ts or ""
+        completed_all = _top_n(itertools.chain(completed_rows, lingering_done), n_completed, key=completed_key)
 
         return {"in_progress": in_progress, "completed": completed_all}
 
@@ -470,30 +914,64 @@ class TradeLedger:
 
         Returns: {"moved": X, "deleted": X, "skipped": Y}
         """
+        return self._cleanup_rows(self.backend.read_active_rows_with_indices(), include_cancelled)
+
+    def _cleanup_rows(self, rows_with_idx: List[Tuple[int, List[Any]]],
+                      include_cancelled: bool) -> Dict[str, int]:
         target_statuses = {STATUS_COMPLETED}
         if include_cancelled:
             target_statuses.add(STATUS_CANCELLED)
 
-        rows_with_idx = self.backend.read_active_rows_with_indices()
         to_move: List[List[Any]] = []
         to_delete: List[int] = []
         skipped = 0
 
         for idx_1, row in rows_with_idx:
             row = (row + [""] * (len(HEADERS) - len(row)))[:len(HEADERS)]
-            rec = dict(zip(HEADERS, row))
-            status = rec.get("status", "").upper()
+            status = row[COL_STATUS].upper()
             if status in target_statuses:
-                to_move.append([rec.get(h, "") for h in HEADERS])
+                to_move.append(row)
                 to_delete.append(idx_1)
             else:
                 skipped += 1
 
-        self.backend.append_completed_rows(to_move)
-        self.backend.delete_active_rows(to_delete)
+        self.backend.move_active_to_completed(to_move, to_delete)
 
         return {"moved": len(to_move), "deleted": len(to_delete), "skipped": skipped}
 
+    # --- asyncio entry points ---
+    # The Sheets client is blocking, so each call runs in a worker thread to keep the event
+    # loop free. SheetsBackend already takes io_lock around every request; these calls also
+    # hold it for the whole operation, so concurrent async calls never interleave their
+    # read-then-write steps.
+
+    async def _run_async(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        def locked() -> Any:
+            with self.backend.io_lock:
+                return fn(*args, **kwargs)
+        return await asyncio.to_thread(locked)
+
+    async def offer_async(self, *args: Any, **kwargs: Any) -> str:
+        return await self._run_async(self.offer, *args, **kwargs)
+
+    async def offer_many_async(self, items: Iterable[Dict[str, Any]]) -> List[str]:
+        return await self._run_async(self.offer_many, list(items))
+
+    async def accept_async(self, offer_id: str, accepter_id: str, accepter_name: str) -> bool:
+        return await self._run_async(self.accept, offer_id, accepter_id, accepter_name)
+
+    async def complete_async(self, offer_id: str) -> bool:
+        return await self._run_async(self.complete, offer_id)
+
+    async def last_async(self, n: int = 5) -> List[Row]:
+        return await self._run_async(self.last, n)
+
+    async def recent_async(self, n_active: int = 5, n_completed: int = 5) -> Dict[str, List[Row]]:
+        return await self._run_async(self.recent, n_active, n_completed)
+
+    async def cleanup_async(self, include_cancelled: bool = False) -> Dict[str, int]:
+        return await self._run_async(self.cleanup, include_cancelled)
+
 # ----------------------------
 # CLI demo / cleanup
 # ----------------------------